@@ -282,9 +282,11 @@ class _ContainerIOManager:
             message = await message_rx.get()
             if message is self._GENERATOR_STOP_SENTINEL:
                 break
-            # ASGI 'http.response.start' and 'http.response.body' msgs are observed to be separated by 1ms.
-            # If we don't sleep here for 1ms we end up with an extra call to .put_data_out().
-            if index == 1:
+            # If nothing else is queued yet, wait 1ms for more messages so that bursts are coalesced into a
+            # single call to .put_data_out(). E.g. ASGI 'http.response.start' and 'http.response.body' msgs
+            # are observed to be separated by 1ms. If messages piled up during the previous .put_data_out(),
+            # flush them right away instead.
+            if message_rx.empty():
                 await asyncio.sleep(0.001)
             messages_bytes = [serialize_data_format(message, data_format)]
             total_size = len(messages_bytes[0]) + 512
@@ -1,7 +1,7 @@
 # Copyright Modal Labs 2022
 import io
 import pickle
-from typing import Any
+from typing import Any, Callable, Iterable, Optional
 
 from modal_proto import api_pb2
 
@@ -11,11 +11,15 @@ from .exception import DeserializationError, InvalidError
 from .object import Object, _Object
 
 PICKLE_PROTOCOL = 4  # Support older Python versions.
+# Serialized bytes double as e.g. Dict keys, so PICKLE_PROTOCOL must stay fixed to keep existing keys
+# addressable. Protocol 5 is only used when the caller opts into out-of-band buffers, which require it.
+PICKLE_PROTOCOL_OUT_OF_BAND = 5
 
 
 class Pickler(cloudpickle.Pickler):
-    def __init__(self, buf):
-        super().__init__(buf, protocol=PICKLE_PROTOCOL)
+    def __init__(self, buf, buffer_callback: Optional[Callable[[pickle.PickleBuffer], Any]] = None):
+        protocol = PICKLE_PROTOCOL if buffer_callback is None else PICKLE_PROTOCOL_OUT_OF_BAND
+        super().__init__(buf, protocol=protocol, buffer_callback=buffer_callback)
 
     def persistent_id(self, obj):
         if isinstance(obj, _Object):
@@ -30,9 +34,9 @@ class Pickler(cloudpickle.Pickler):
 
 
 class Unpickler(pickle.Unpickler):
-    def __init__(self, client, buf):
+    def __init__(self, client, buf, buffers: Optional[Iterable[Any]] = None):
         self.client = client
-        super().__init__(buf)
+        super().__init__(buf, buffers=buffers)
 
     def persistent_load(self, pid):
         (object_id, flag, handle_proto) = pid
@@ -45,20 +49,24 @@ class Unpickler(pickle.Unpickler):
             raise InvalidError("bad flag")
 
 
-def serialize(obj: Any) -> bytes:
-    """Serializes object and replaces all references to the client class by a placeholder."""
+def serialize(obj: Any, buffer_callback: Optional[Callable[[pickle.PickleBuffer], Any]] = None) -> bytes:
+    """Serializes object and replaces all references to the client class by a placeholder.
+
+    If `buffer_callback` is given, `PickleBuffer` objects are passed to it out-of-band instead of
+    being copied into the returned bytes; the same buffers must then be passed to `deserialize`.
+    """
     buf = io.BytesIO()
-    Pickler(buf).dump(obj)
+    Pickler(buf, buffer_callback=buffer_callback).dump(obj)
     return buf.getvalue()
 
 
-def deserialize(s: bytes, client) -> Any:
+def deserialize(s: bytes, client, buffers: Optional[Iterable[Any]] = None) -> Any:
     """Deserializes object and replaces all client placeholders by self."""
     from .execution_context import is_local  # Avoid circular import
 
     env = "local" if is_local() else "remote"
     try:
-        return Unpickler(client, io.BytesIO(s)).load()
+        return Unpickler(client, io.BytesIO(s), buffers=buffers).load()
     except AttributeError as exc:
         # We use a different cloudpickle version pre- and post-3.11. Unfortunately cloudpickle
         # doesn't expose some kind of serialization version number, so we have to guess based
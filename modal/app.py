@@ -119,6 +119,7 @@ class _App:
     _name: Optional[str]
     _description: Optional[str]
     _indexed_objects: Dict[str, _Object]
+    _functions: Dict[str, _Function]  # Subset of _indexed_objects, kept in sync by _add_object
     _function_mounts: Dict[str, _Mount]
     _image: Optional[_Image]
     _mounts: Sequence[_Mount]
@@ -175,6 +176,7 @@ class _App:
             self._validate_blueprint_value(k, v)
 
         self._indexed_objects = kwargs
+        self._functions = {}
         self._image = image
         self._mounts = mounts
         self._secrets = secrets
@@ -231,6 +233,10 @@ class _App:
                 obj._hydrate(object_id, self._client, metadata)
 
         self._indexed_objects[tag] = obj
+        if isinstance(obj, _Function):
+            self._functions[tag] = obj
+        else:
+            self._functions.pop(tag, None)
 
     def __getitem__(self, tag: str):
         """App assignments of the form `app.x` or `app["x"]` are deprecated!
@@ -351,7 +357,16 @@ class _App:
         for function in self.registered_functions.values():
             all_mounts.extend(function._all_mounts)
 
-        return [m for m in all_mounts if m.is_local()]
+        # Mounts shared between functions (including the app's default mounts) would otherwise appear once
+        # per function, and the watcher would resolve each of them repeatedly. Mounts aren't hashable by
+        # value, so drop duplicates by identity.
+        seen_ids = set()
+        watch_mounts = []
+        for m in all_mounts:
+            if id(m) not in seen_ids and m.is_local():
+                seen_ids.add(id(m))
+                watch_mounts.append(m)
+        return watch_mounts
 
     def _add_function(self, function: _Function):
         if function.tag in self._indexed_objects:
@@ -383,7 +398,7 @@ class _App:
     @property
     def registered_functions(self) -> Dict[str, _Function]:
         """All modal.Function objects registered on the app."""
-        return {tag: obj for tag, obj in self._indexed_objects.items() if isinstance(obj, _Function)}
+        return dict(self._functions)  # copy, so callers can't desync it from _indexed_objects
 
     @property
     def registered_classes(self) -> Dict[str, _Function]:
@@ -141,8 +141,6 @@ def _infer_function_or_help(
     if accept_local_entrypoint:
         function_choices |= set(app.registered_entrypoints.keys())
 
-    sorted_function_choices = sorted(function_choices)
-    registered_functions_str = "\n".join(sorted_function_choices)
     filtered_local_entrypoints = [
         name
         for name, entrypoint in app.registered_entrypoints.items()
@@ -152,13 +150,13 @@ def _infer_function_or_help(
     if accept_local_entrypoint and len(filtered_local_entrypoints) == 1:
         # If there is just a single local entrypoint in the target module, use
         # that regardless of other functions.
-        function_name = list(filtered_local_entrypoints)[0]
+        function_name = filtered_local_entrypoints[0]
     elif accept_local_entrypoint and len(app.registered_entrypoints) == 1:
         # Otherwise, if there is just a single local entrypoint in the stub as a whole,
         # use that one.
-        function_name = list(app.registered_entrypoints.keys())[0]
+        function_name = next(iter(app.registered_entrypoints))
     elif len(function_choices) == 1:
-        function_name = sorted_function_choices[0]
+        function_name = next(iter(function_choices))
     elif len(function_choices) == 0:
         if app.registered_web_endpoints:
             err_msg = "Modal app has only web endpoints. Use `modal serve` instead of `modal run`."
@@ -166,6 +164,7 @@ def _infer_function_or_help(
             err_msg = "Modal app has no registered functions. Nothing to run."
         raise click.UsageError(err_msg)
     else:
+        registered_functions_str = "\n".join(sorted(function_choices))
         help_text = f"""You need to specify a Modal function or local entrypoint to run, e.g.
 
 modal run app.py::my_function [...args]
@@ -7,6 +7,7 @@ from google.protobuf.empty_pb2 import Empty
 from grpclib import GRPCError, Status
 
 from modal import App, Dict, Image, Mount, Queue, Secret, Stub, Volume, web_endpoint
+from modal._utils.async_utils import synchronizer
 from modal.app import list_apps  # type: ignore
 from modal.config import config
 from modal.exception import DeprecationError, ExecutionError, InvalidError, NotFoundError
@@ -198,6 +199,22 @@ def test_registered_web_endpoints(client, servicer):
     assert app.registered_web_endpoints == ["web1", "web2"]
 
 
+def test_registered_functions(client, servicer):
+    app = App()
+    app.function()(square)
+    app.function()(web_endpoint()(web1))
+
+    assert sorted(app.registered_functions) == ["square", "web1"]
+
+    # Mutating the returned dict doesn't affect the app
+    app.registered_functions.pop("square")
+    assert sorted(app.registered_functions) == ["square", "web1"]
+
+    # Overwriting a function's tag with a non-function object unregisters the function
+    synchronizer._translate_in(app)._add_object("square", synchronizer._translate_in(Dict.from_name("d")))
+    assert sorted(app.registered_functions) == ["web1"]
+
+
 def test_init_types():
     with pytest.raises(InvalidError):
         # singular secret to plural argument
@@ -100,6 +100,7 @@ class MockClientServicer(api_grpc.ModalClientBase):
         self.n_dict_heartbeats = 0
         self.n_queue_heartbeats = 0
         self.n_nfs_heartbeats = 0
+        self.nfs_heartbeats_done = threading.Event()  # Set on the second NFS heartbeat
         self.n_vol_heartbeats = 0
         self.n_mounts = 0
         self.n_mount_files = 0
@@ -750,6 +751,7 @@ class MockClientServicer(api_grpc.ModalClientBase):
 
     async def FunctionCallPutDataOut(self, stream):
         req: api_pb2.FunctionCallPutDataRequest = await stream.recv_message()
+        self.requests.append(req)
         for chunk in req.data_chunks:
             await self.fc_data_out[req.function_call_id].put(chunk)
         await stream.send_message(Empty())
@@ -1080,6 +1082,8 @@ class MockClientServicer(api_grpc.ModalClientBase):
     async def SharedVolumeHeartbeat(self, stream):
         await stream.recv_message()
         self.n_nfs_heartbeats += 1
+        if self.n_nfs_heartbeats >= 2:
+            self.nfs_heartbeats_done.set()
         await stream.send_message(Empty())
 
     async def SharedVolumePutFile(self, stream):
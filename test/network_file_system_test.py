@@ -1,6 +1,5 @@
 # Copyright Modal Labs 2022
 import pytest
-import time
 from io import BytesIO
 from unittest import mock
 
@@ -137,7 +136,8 @@ def test_nfs_ephemeral(servicer, client, tmp_path):
         (entry,) = nfs.listdir("/")
         assert entry.path == "xyz.txt"
 
-        time.sleep(1.5)  # Make time for 2 heartbeats
+        # Wait for 2 heartbeats (the servicer runs on the synchronicity thread, hence threading.Event)
+        assert servicer.nfs_heartbeats_done.wait(timeout=5.0)
     assert servicer.n_nfs_heartbeats == 2
 
 
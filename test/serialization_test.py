@@ -1,4 +1,5 @@
 # Copyright Modal Labs 2022
+import pickle
 import pytest
 import random
 
@@ -51,3 +52,18 @@ def test_deserialization_error(client):
     )
     with pytest.raises(DeserializationError, match="'undeserializable_module' .+ local environment"):
         deserialize(obj, client)
+
+
+def test_out_of_band_buffers(client):
+    payload = bytearray(b"x" * 1024)
+    buffers: list = []
+    data = serialize(pickle.PickleBuffer(payload), buffer_callback=buffers.append)
+    assert len(buffers) == 1
+    assert len(data) < len(payload)
+    roundtrip = deserialize(data, client, buffers=buffers)
+    assert bytes(roundtrip) == bytes(payload)
+
+
+def test_serialized_keys_are_stable():
+    # Dict keys are looked up by their serialized bytes, so these must not change across client versions
+    assert serialize("a") == pickle.dumps("a", protocol=4)
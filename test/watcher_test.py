@@ -56,3 +56,17 @@ def test_watch_mounts_ignore_local():
 
     mounts = app._get_watch_mounts()
     assert len(mounts) == 0
+
+
+def dummy_2():
+    pass
+
+
+def test_watch_mounts_dedupes_shared_mounts(test_dir):
+    app = modal.App()
+    shared_mount = Mount.from_local_dir(test_dir / "supports", remote_path="/supports")
+    app.function(mounts=[shared_mount])(dummy)
+    app.function(mounts=[shared_mount])(dummy_2)
+
+    mounts = app._get_watch_mounts()
+    assert len([m for m in mounts if m is shared_mount]) == 1